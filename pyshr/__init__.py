@@ -0,0 +1,30 @@
+"""
+    Package is wrapper for the libshr C library implemented using CFFI
+"""
+from .__about__ import (__author__, __email__, __libshr_version__, __license__,
+                        __summary__, __title__, __uri__, __version__)
+
+__all__ = [
+    "__title__", "__summary__", "__uri__", "__version__", "__author__",
+    "__email__", "__license__", "__libshr_version__", 'ShareException',
+    'SQMode', 'SQEvent', 'SHType', 'SharedQueue'
+]
+
+# names provided by the pyshr module, which loads the compiled _pyshr
+# extension -- imported on first use so "import pyshr" stays pure Python
+_LAZY = frozenset(('ShareException', 'SQMode', 'SQEvent', 'SHType',
+                   'SharedQueue'))
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from . import pyshr
+        value = getattr(pyshr, name)
+        globals()[name] = value
+        return value
+    raise AttributeError('module ' + repr(__name__) + ' has no attribute '
+                         + repr(name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
@@ -0,0 +1,773 @@
+"""
+    Package is wrapper for the libshr C library implemented using CFFI
+"""
+from array import array
+from enum import IntEnum
+from functools import lru_cache
+import signal
+import sys
+
+from .__about__ import (__author__, __email__, __libshr_version__, __license__,
+                        __summary__, __title__, __uri__, __version__)
+from ._pyshr import ffi, lib
+
+__all__ = [
+    "__title__", "__summary__", "__uri__", "__version__", "__author__",
+    "__email__", "__license__", "__libshr_version__", 'ShareException',
+    'SQMode', 'SQEvent', 'SHType', 'SharedQueue'
+]
+
+# scratch allocations are always fully initialized before use, so skip the
+# zero fill that ffi.new performs by default
+_alloc = ffi.new_allocator(should_clear_after_alloc=False)
+
+
+
+_NSEC_PER_SEC = 1000000000
+
+
+def _to_ns(time):
+    ''' returns time in seconds as whole nanoseconds
+    '''
+    return round(time * _NSEC_PER_SEC)
+
+
+def _split_time(time):
+    ''' returns time in seconds as whole seconds and nanoseconds
+    '''
+    return divmod(_to_ns(time), _NSEC_PER_SEC)
+
+
+class ShareException(Exception):
+    pass
+
+
+def _to_cbuf(op, data):
+    ''' returns str or buffer protocol data as char array whose len() is
+        its size in bytes, sharing the memory of buffer objects rather than
+        copying it
+    '''
+    if isinstance(data, str):
+        data = data.encode()
+    try:
+        return ffi.from_buffer('char[]', data)
+    except TypeError:
+        raise ShareException(op, 'incompatible data type', data) from None
+
+
+class ShareError():
+    # status descriptions read from libshr once at import, so raising an
+    # exception is a list lookup and stays in step with the library enum
+    text = [ffi.string(lib.shr_explain(status)).decode()
+            for status in range(lib.SH_ERR_MAX)]
+
+
+class SHStatus():
+    SH_OK = 0                  # success
+    SH_RETRY = 1               # retry previous
+    SH_ERR_EMPTY = 2           # no items available
+    SH_ERR_LIMIT = 3           # depth limit reached
+    SH_ERR_ARG = 4             # invalid argument
+    SH_ERR_NOMEM = 5           # not enough memory to satisfy request
+    SH_ERR_ACCESS = 6          # permission error
+    SH_ERR_EXIST = 7           # existence error
+    SH_ERR_STATE = 8           # invalid state
+    SH_ERR_PATH = 9            # problem with path name
+    SH_ERR_NOSUPPORT = 10      # required operation not supported
+    SH_ERR_SYS = 11            # system error
+    SH_ERR_CONFLICT = 12       # update conflict
+    SH_ERR_NO_MATCH = 13       # no match found for key
+    SH_ERR_MAX = 14
+
+    @staticmethod
+    def is_valid(status):
+        return _status_ok(status)
+
+
+class SQMode(IntEnum):
+    IMMUTABLE = 0
+    READ_ONLY = 1
+    WRITE_ONLY = 2
+    READWRITE = 3
+
+    @staticmethod
+    def is_valid(mode):
+        return _mode_ok(mode)
+
+
+class SQEvent(IntEnum):
+    ALL = 0         # not an event, used to simplify subscription
+    NONE = 0        # non-event
+    INIT = 1        # first item added to queue
+    LIMIT = 2       # queue limit reached
+    TIME = 3        # max time limit reached
+    LEVEL = 4       # depth level reached
+    EMPTY = 5       # last item on queue removed
+    NONEMPTY = 6    # item added to empty queue
+
+    @staticmethod
+    def is_valid(event):
+        return _event_ok(event)
+
+
+class SHType(IntEnum):
+    VECTOR_T = 0            # vector of multiple types
+    STRM_T = 1              # unspecified byte stream
+    INTEGER_T = 2           # integer data type determined by length
+    FLOAT_T = 3             # floating point type determined by length
+    ASCII_T = 4             # ascii string (char values 0-127)
+    UTF8_T = 5              # utf-8 string
+    UTF16_T = 6             # utf-16 string
+    JSON_T = 7              # json string
+    XML_T = 8               # xml string
+    STRUCT_T = 9            # binary struct
+
+    @staticmethod
+    def is_valid(sqtype):
+        return _shtype_ok(sqtype)
+
+
+_VALID_STATUSES = frozenset(range(SHStatus.SH_OK, SHStatus.SH_ERR_MAX))
+_VALID_MODES = frozenset(range(SQMode.IMMUTABLE, SQMode.READWRITE + 1))
+_VALID_EVENTS = frozenset(range(SQEvent.NONE, SQEvent.NONEMPTY + 1))
+_VALID_SHTYPES = frozenset(range(SHType.VECTOR_T, SHType.STRUCT_T + 1))
+
+
+def _status_ok(status):
+    return isinstance(status, int) and status in _VALID_STATUSES
+
+
+def _mode_ok(mode):
+    return isinstance(mode, int) and mode in _VALID_MODES
+
+
+def _event_ok(event):
+    return isinstance(event, int) and event in _VALID_EVENTS
+
+
+def _shtype_ok(sqtype):
+    return isinstance(sqtype, int) and sqtype in _VALID_SHTYPES
+
+
+def _chk(op, status):
+    ''' raises exception for operation if libshr status is an error
+    '''
+    if status:
+        raise ShareException(op, _ERR_TEXT[status])
+
+
+# names used on the add/remove paths, bound once at import so calls avoid
+# an attribute lookup on lib for every constant and function
+_ERR_TEXT = ShareError.text
+_SH_ERR_ARG = lib.SH_ERR_ARG
+_SH_ERR_EMPTY = lib.SH_ERR_EMPTY
+_SH_STRM_T = lib.SH_STRM_T
+_SH_INTEGER_T = lib.SH_INTEGER_T
+_SH_FLOAT_T = lib.SH_FLOAT_T
+_SH_ASCII_T = lib.SH_ASCII_T
+_SH_UTF8_T = lib.SH_UTF8_T
+_SH_JSON_T = lib.SH_JSON_T
+_SH_XML_T = lib.SH_XML_T
+_shr_q_add = lib.shr_q_add
+_shr_q_add_wait = lib.shr_q_add_wait
+_pyshr_addv_unpacked = lib.pyshr_addv_unpacked
+_pyshr_addv_unpacked_wait = lib.pyshr_addv_unpacked_wait
+_pyshr_remove_into = lib.pyshr_remove_into
+_pyshr_remove_wait_into = lib.pyshr_remove_wait_into
+
+
+def _h_int(data):
+    if not isinstance(data, int):
+        raise ShareException('__to_vector', _ERR_TEXT[_SH_ERR_ARG],
+                             data)
+    return _SH_INTEGER_T, _alloc('long long *', data), 8
+
+
+def _h_float(data):
+    return _SH_FLOAT_T, _alloc('double *', data), 8
+
+
+# strings up to this length have their utf-8 encoding cached, so repeated
+# keys and tags are not re-encoded on every add
+_ENCODE_CACHE_LEN = 256
+
+
+@lru_cache(maxsize=1024)
+def _encode_utf8(data):
+    return data.encode(encoding = 'utf-8')
+
+
+def _text_handler(sh_type):
+    ''' returns handler that stores str (utf-8 encoded) or bytes-like data
+        as the specified type
+    '''
+    def handler(data):
+        if isinstance(data, str):
+            if len(data) <= _ENCODE_CACHE_LEN:
+                data = _encode_utf8(data)
+            else:
+                data = data.encode(encoding = 'utf-8')
+        buf = _to_cbuf('__to_vector', data)
+        return sh_type, buf, len(buf)
+    return handler
+
+
+_h_stream = _text_handler(_SH_STRM_T)
+_h_ascii = _text_handler(_SH_ASCII_T)
+
+
+def _h_default(data):
+    # int subclasses such as the IntEnum classes miss the exact type lookup
+    if isinstance(data, int) and not isinstance(data, bool):
+        return _h_int(data)
+    try:
+        len(data)
+    except TypeError:
+        raise ShareException('__to_vector', _ERR_TEXT[_SH_ERR_ARG],
+                             data) from None
+    return _h_stream(data)
+
+
+# handlers for untagged items, keyed by python type
+_DISPATCH = {
+    int: _h_int,
+    float: _h_float,
+    str: _h_ascii,
+    bytes: _h_stream,
+}
+
+# handlers for (SHType, value) tuples, types not listed are sent as streams
+_SHTYPE_DISPATCH = {
+    _SH_STRM_T: _h_stream,
+    _SH_INTEGER_T: _h_int,
+    _SH_FLOAT_T: _h_float,
+    _SH_ASCII_T: _h_ascii,
+    _SH_UTF8_T: _text_handler(_SH_UTF8_T),
+    _SH_JSON_T: _text_handler(_SH_JSON_T),
+    _SH_XML_T: _text_handler(_SH_XML_T),
+}
+
+
+def _py_int(base, length):
+    if length == 4:
+        return ffi.cast('int *', base)[0]
+    return ffi.cast('long long *', base)[0]
+
+
+def _py_float(base, length):
+    if length != 8:
+        raise ShareException('__to_list', 'incompatible float type')
+    return ffi.cast('double *', base)[0]
+
+
+def _py_bytes(base, length):
+    return ffi.unpack(ffi.cast('char *', base), length)
+
+
+def _py_str(base, length):
+    return ffi.unpack(ffi.cast('char *', base), length).decode()
+
+
+def _py_xml(base, length):
+    return (_SH_XML_T, _py_bytes(base, length))
+
+
+def _py_json(base, length):
+    return (_SH_JSON_T, _py_str(base, length))
+
+
+def _py_unknown(base, length):
+    raise ShareException('__to_list', 'incompatible data type')
+
+
+# converters from vector entries to python values, indexed by sh_type_e
+_TO_PY = [_py_unknown] * (SHType.STRUCT_T + 1)
+_TO_PY[_SH_INTEGER_T] = _py_int
+_TO_PY[_SH_FLOAT_T] = _py_float
+_TO_PY[_SH_ASCII_T] = _py_str
+_TO_PY[_SH_STRM_T] = _py_bytes
+_TO_PY[_SH_XML_T] = _py_xml
+_TO_PY[_SH_UTF8_T] = _py_str
+_TO_PY[_SH_JSON_T] = _py_json
+
+
+# single element initializers for the addv type and length arrays, the
+# length array typecode matches size_t on linux
+_TYPES_INIT = array('i', [0])
+_LENS_INIT = array('L', [0])
+
+# number of distinct item counts whose addv arrays are kept per queue
+_VEC_POOL_SIZE = 8
+
+# items removed per call into libshr by remove_many
+_REMOVE_BATCH = 128
+
+
+class _Vector:
+    ''' parallel type, length and data pointer arrays for the
+        pyshr_addv_unpacked shims, along with the sq_vec_s array they fill,
+        reused across addv calls of same count
+    '''
+    __slots__ = ('count', 'types', 'lens', 'c_types', 'c_lens', 'bases',
+                 'vec')
+
+    def __init__(self, count):
+        self.count = count
+        self.types = _TYPES_INIT * count
+        self.lens = _LENS_INIT * count
+        self.c_types = ffi.from_buffer('int[]', self.types)
+        self.c_lens = ffi.from_buffer('size_t[]', self.lens)
+        self.bases = _alloc('void *[]', count)
+        self.vec = _alloc('sq_vec_s[]', count)
+
+
+class SharedQueue:
+    ''' python access to a libshr shared memory queue
+
+        cffi releases the GIL for the duration of every libshr call, so the
+        *_wait and *_timedwait methods let other threads run while blocked
+    '''
+
+    @staticmethod
+    def is_valid(name):
+        ''' checks that name matches an existing = 1 valid queue '''
+        if name is None or not isinstance(name, str):
+            raise ShareException('is_valid', _ERR_TEXT[_SH_ERR_ARG])
+        return lib.shr_q_is_valid(name.encode(encoding = 'utf-8'))
+
+    def __init__(self, name, mode, size=0):
+        ''' constructor for queue object
+            name - string name of queue
+            mode - SQMode instance for access
+            size - max size if creating new queue, 0 defaults to system max
+        '''
+        if not _mode_ok(mode):
+            raise ShareException('constructor',
+                                 _ERR_TEXT[_SH_ERR_ARG],
+                                 mode)
+        if name is None or not isinstance(name, str):
+            raise ShareException('constructor',
+                                 _ERR_TEXT[_SH_ERR_ARG],
+                                 name)
+        if not isinstance(size, int):
+            raise ShareException('constructor',
+                                 _ERR_TEXT[_SH_ERR_ARG],
+                                 size)
+
+        name = name.encode(encoding = 'utf-8')
+        self.pq = ffi.new("shr_q_s *[1]")
+        if lib.shr_q_is_valid(name) and size == 0:
+            _chk('open', lib.shr_q_open(self.pq, name, mode))
+        else:
+            _chk('create', lib.shr_q_create(self.pq, name, size, mode))
+        self._open = True
+        self._q = self.pq[0]
+        self.buff = ffi.new("void *[1]")
+        self.buff_sz = ffi.new('size_t *')
+        self.buff[0] = ffi.NULL
+        self.buff_sz[0] = 0
+        self._item = ffi.new('sq_item_s *')
+        self._vec_pool = {}
+        self._batch = None
+
+    def __release_buffer(self):
+        ''' frees the receive buffers that libshr allocated and resized
+        '''
+        if self.buff[0]:
+            lib.free(self.buff[0])
+            self.buff[0] = ffi.NULL
+            self.buff_sz[0] = 0
+        if self._batch is not None:
+            bufs = self._batch[1]
+            for i in range(_REMOVE_BATCH):
+                if bufs[i]:
+                    lib.free(bufs[i])
+            self._batch = None
+
+    def destroy(self):
+        ''' destroy queue
+        '''
+        if not self._open:
+            raise ShareException('destroy', _ERR_TEXT[_SH_ERR_ARG])
+        _chk('destroy', lib.shr_q_destroy(self.pq))
+        self._open = False
+        self._q = ffi.NULL
+        self.__release_buffer()
+
+    def close(self):
+        ''' close queue instance, preserves queue
+        '''
+        if not self._open:
+            raise ShareException('close', _ERR_TEXT[_SH_ERR_ARG])
+        _chk('close', lib.shr_q_close(self.pq))
+        self._open = False
+        self._q = ffi.NULL
+        self.__release_buffer()
+
+    def add(self, data):
+        ''' add data stream to queue
+        '''
+        if type(data) is not bytes:
+            data = _to_cbuf('add', data)
+        _chk('add', _shr_q_add(self._q, data, len(data)))
+
+    def add_wait(self, data):
+        ''' add data stream to queue, block if full
+        '''
+        if type(data) is not bytes:
+            data = _to_cbuf('add_wait', data)
+        _chk('add_wait', _shr_q_add_wait(self._q, data, len(data)))
+
+    def add_timedwait(self, data, time):
+        '''
+        add data stream to queue, block for time if full
+        data - string, bytes, bytearray or memoryview to put on queue
+        time - float of time to wait
+        '''
+        if type(data) is not bytes:
+            data = _to_cbuf('add_timedwait', data)
+        _chk('add_timedwait',
+             lib.pyshr_add_timedwait_ns(self._q, data, len(data),
+                                        _to_ns(time)))
+
+    def add_and_event(self, data):
+        ''' add data stream to queue and return active event, saving the
+            separate call to event
+        '''
+        if type(data) is not bytes:
+            data = _to_cbuf('add_and_event', data)
+        status = _alloc('sh_status_e *')
+        event = lib.pyshr_add_and_event(self._q, data, len(data), status)
+        _chk('add_and_event', status[0])
+        return int(event)
+
+    def __take_vector(self, count):
+        ''' returns pooled vector arrays for count items
+        '''
+        vector = self._vec_pool.pop(count, None)
+        if vector is None:
+            vector = _Vector(count)
+        return vector
+
+    def __to_vector(self, items):
+        ''' fills pooled parallel arrays for items, returns them along with
+            the cdata that must be kept alive until the items are added
+        '''
+        vector = self.__take_vector(len(items))
+        types = vector.types
+        lens = vector.lens
+        bases = vector.bases
+        buffers = []
+        for i, data in enumerate(items):
+            if type(data) is tuple:
+                if len(data) != 2 or not _shtype_ok(data[0]):
+                    raise ShareException('__to_vector',
+                                         _ERR_TEXT[_SH_ERR_ARG], data)
+                handler = _SHTYPE_DISPATCH.get(data[0], _h_default)
+                data = data[1]
+            else:
+                handler = _DISPATCH.get(type(data), _h_default)
+            types[i], buf, lens[i] = handler(data)
+            buffers.append(buf)
+            bases[i] = buf
+        return vector, buffers
+
+    def __release_vector(self, vector):
+        ''' returns vector arrays to pool, dropping least recently used size
+        '''
+        pool = self._vec_pool
+        pool[vector.count] = vector
+        if len(pool) > _VEC_POOL_SIZE:
+            del pool[next(iter(pool))]
+
+    def addv(self, items):
+        ''' add list to queue
+        '''
+        if not isinstance(items, (list, tuple)):
+            raise ShareException('add', 'incompatible data type', items)
+        vector, buffers = self.__to_vector(items)
+        status = _pyshr_addv_unpacked(self._q, vector.vec, vector.c_types,
+                                      vector.c_lens, vector.bases,
+                                      vector.count)
+        self.__release_vector(vector)
+        _chk('add', status)
+
+    def addv_wait(self, items):
+        ''' add arbitrary data to queue, block if full
+        '''
+        if not isinstance(items, (list, tuple)):
+            raise ShareException('add', 'incompatible data type', items)
+        vector, buffers = self.__to_vector(items)
+        status = _pyshr_addv_unpacked_wait(self._q, vector.vec,
+                                           vector.c_types, vector.c_lens,
+                                           vector.bases, vector.count)
+        self.__release_vector(vector)
+        _chk('add_wait', status)
+
+    def addv_timedwait(self, items, time):
+        ''' add arbitrary data to queue, block for time if full
+            items - list of items to put on queue
+            time - float of time to wait
+        '''
+        if not isinstance(items, (list, tuple)):
+            raise ShareException('add', 'incompatible data type', items)
+        vector, buffers = self.__to_vector(items)
+        status = lib.pyshr_addv_unpacked_timedwait(self._q, vector.vec,
+                                                   vector.c_types,
+                                                   vector.c_lens, vector.bases,
+                                                   vector.count, _to_ns(time))
+        self.__release_vector(vector)
+        _chk('add_timedwait', status)
+
+    def add_many(self, items):
+        ''' add each string or bytes-like object in list to queue as a
+            separate item using a single call into libshr, on failure the
+            exception also carries the count of items that were added
+        '''
+        if not isinstance(items, (list, tuple)):
+            raise ShareException('add_many', 'incompatible data type', items)
+        vector = self.__take_vector(len(items))
+        lens = vector.lens
+        bases = vector.bases
+        buffers = []
+        for i, data in enumerate(items):
+            if isinstance(data, str):
+                data = data.encode()
+            elif not isinstance(data, (bytes, bytearray, memoryview)):
+                raise ShareException('add_many', 'incompatible data type',
+                                     data)
+            buf = ffi.from_buffer('char[]', data)
+            buffers.append(buf)
+            lens[i] = len(buf)
+            bases[i] = buf
+        added = _alloc('int *')
+        status = lib.pyshr_add_many(self._q, bases, vector.c_lens,
+                                    vector.count, added)
+        self.__release_vector(vector)
+        if status:
+            raise ShareException('add_many', _ERR_TEXT[status], added[0])
+
+    def __to_list(self, item):
+        vcount = item.vcount
+        vector = item.vector
+        if vcount == 1:
+            # single stream items, as queued by add, skip the converter table
+            vec = vector[0]
+            if vec.type == _SH_STRM_T:
+                return [ffi.unpack(ffi.cast('char *', vec.base), vec.len)]
+            return [_TO_PY[vec.type](vec.base, vec.len)]
+        result = []
+        for i in range(vcount):
+            vec = vector[i]
+            result.append(_TO_PY[vec.type](vec.base, vec.len))
+        return result
+
+    def remove(self):
+        ''' remove item from queue without blocking
+        '''
+        item = self._item
+        status = _pyshr_remove_into(self._q, item, self.buff, self.buff_sz)
+        if status == _SH_ERR_EMPTY:
+            return []
+        _chk('remove', status)
+        return self.__to_list(item)
+
+    def remove_wait(self):
+        ''' remove item from queue, block if empty
+        '''
+        item = self._item
+        status = _pyshr_remove_wait_into(self._q, item, self.buff,
+                                         self.buff_sz)
+        if status == _SH_ERR_EMPTY:
+            return []
+        _chk('remove_wait', status)
+        return self.__to_list(item)
+
+    def remove_timedwait(self, time):
+        ''' remove item from queue, block for time if empty
+            time - float of time to wait
+        '''
+        item = self._item
+        status = lib.pyshr_remove_timedwait_into(self._q, item, self.buff,
+                                                 self.buff_sz, _to_ns(time))
+        if status == _SH_ERR_EMPTY:
+            return []
+        _chk('remove_timedwait', status)
+        return self.__to_list(item)
+
+    def remove_many(self, count):
+        ''' remove up to count items from queue without blocking, returns
+            list of removed items, each a list as returned by remove
+        '''
+        if not isinstance(count, int) or count < 1:
+            raise ShareException('remove_many', _ERR_TEXT[_SH_ERR_ARG], count)
+        if self._batch is None:
+            self._batch = (ffi.new('sq_item_s[]', _REMOVE_BATCH),
+                           ffi.new('void *[]', _REMOVE_BATCH),
+                           ffi.new('size_t[]', _REMOVE_BATCH))
+        items, bufs, sizes = self._batch
+        status = _alloc('sh_status_e *')
+        result = []
+        while count:
+            batch = min(count, _REMOVE_BATCH)
+            removed = lib.pyshr_remove_batch_into(self._q, items, batch, bufs,
+                                                  sizes, status)
+            for i in range(removed):
+                result.append(self.__to_list(items[i]))
+            if removed < batch:
+                break
+            count -= removed
+        if not result and status[0] != _SH_ERR_EMPTY:
+            _chk('remove_many', status[0])
+        return result
+
+    def __register_signal(self, op, register, signo):
+        if not isinstance(signo, int):
+            raise ShareException(op, _ERR_TEXT[_SH_ERR_ARG])
+        _chk(op, register(self._q, signo))
+
+    def monitor(self, signo):
+        ''' registers as monitoring process using specified signal
+        '''
+        self.__register_signal('monitor', lib.shr_q_monitor, signo)
+
+    def listen(self, signo):
+        ''' registers as listening process for arrivals using specified signal
+        '''
+        self.__register_signal('listen', lib.shr_q_listen, signo)
+
+    def call(self, signo):
+        ''' registers as called process for blocked removes using specified signal
+        '''
+        self.__register_signal('call', lib.shr_q_call, signo)
+
+    def event(self):
+        ''' return active event
+        '''
+        return int(lib.shr_q_event(self._q))
+
+    def exceeds_idle_time(self, time):
+        ''' tests to see if no item has been added within the specified time
+        '''
+        seconds, nanoseconds = _split_time(time)
+        return lib.shr_q_exceeds_idle_time(self._q, seconds, nanoseconds)
+
+    def count(self):
+        ''' count of items on queue
+        '''
+        return int(lib.shr_q_count(self._q))
+
+    def level(self, depth):
+        ''' sets value for queue depth level event generation and for adaptive LIFO
+        '''
+        if depth is None or not isinstance(depth, int):
+            raise ShareException('level', _ERR_TEXT[_SH_ERR_ARG])
+        _chk('level', lib.shr_q_level(self._q, depth))
+
+    def timelimit(self, time):
+        ''' sets time limit of item on queue before producing a max time limit event
+        '''
+        seconds, nanoseconds = _split_time(time)
+        _chk('timelimit',
+             lib.shr_q_timelimit(self._q, seconds, nanoseconds))
+
+    def clean(self, time):
+        ''' remove items from front of queue that have exceeded timelimit
+        '''
+        _chk('clean', lib.pyshr_clean_ns(self._q, _to_ns(time)))
+
+    def last_empty(self):
+        ''' returns timestamp of last time queue became non-empty
+        '''
+        ts = ffi.new('struct timespec *')
+        _chk('last_empty', lib.shr_q_last_empty(self._q, ts))
+        return (ts.tv_sec, ts.tv_nsec)
+
+    def discard(self, flag):
+        ''' discard items that exceed expiration time limit
+        '''
+        if flag is None or not isinstance(flag, bool):
+            raise ShareException('discard', _ERR_TEXT[_SH_ERR_ARG])
+        _chk('discard', lib.shr_q_discard(self._q, flag))
+
+    def will_discard(self):
+        ''' tests to see if queue will discard expired items
+        '''
+        return lib.shr_q_will_discard(self._q)
+
+    def limit_lifo(self, flag):
+        ''' treat depth limit as limit for adaptive LIFO behavior
+        '''
+        if flag is None or not isinstance(flag, bool):
+            raise ShareException('limit_lifo', _ERR_TEXT[_SH_ERR_ARG])
+
+        _chk('limit_lifo', lib.shr_q_limit_lifo(self._q, flag))
+
+    def will_lifo(self):
+        ''' tests to see if queue will used adaptive LIFO
+        '''
+        return lib.shr_q_will_lifo(self._q)
+
+    def subscribe(self, event):
+        ''' subscribe to see specified event
+        '''
+        if not _event_ok(event):
+            raise ShareException('subscribe', _ERR_TEXT[_SH_ERR_ARG])
+
+        _chk('subscribe', lib.shr_q_subscribe(self._q, event))
+
+    def unsubscribe(self, event):
+        ''' remove subscription for specified event
+        '''
+        if not _event_ok(event):
+            raise ShareException('unsubscribe', _ERR_TEXT[_SH_ERR_ARG])
+        _chk('unsubscribe', lib.shr_q_unsubscribe(self._q, event))
+
+    def is_subscribed(self, event):
+        ''' returns true if event subscribed, otherwise false
+        '''
+        if not _event_ok(event):
+            raise ShareException('is_subscribed',
+                                 _ERR_TEXT[_SH_ERR_ARG])
+        return lib.shr_q_is_subscribed(self._q, event)
+
+    def prod(self):
+        ''' activates at least one blocked caller
+        '''
+        _chk('prod', lib.shr_q_prod(self._q))
+
+    def call_count(self):
+        ''' count of blocked remove calls
+        '''
+        return int(lib.shr_q_call_count(self._q))
+
+    def target_delay(self, time):
+        ''' sets target delay and activates CoDel algorithm
+        '''
+        seconds, nanoseconds = _split_time(time)
+        _chk('target_delay',
+             lib.shr_q_target_delay(self._q, seconds, nanoseconds))
+
+if __name__ == '__main__':
+    try:
+        if not SharedQueue.is_valid('testq'):
+            print("queue doesn't exist")
+        q = SharedQueue('testq', SQMode.READWRITE)
+        print("queue count ", q.count())
+        q.addv([(SHType.INTEGER_T, 4), (SHType.JSON_T, '{"test":"value"}'), (SHType.XML_T, '<doc/>')])
+        q.addv(((SHType.INTEGER_T, 4), (SHType.JSON_T, '{"test":"value"}'), (SHType.XML_T, '<doc/>')))
+        q.addv_wait([(SHType.INTEGER_T, 4), (SHType.JSON_T, '{"test":"value"}'), (SHType.XML_T, '<doc/>')])
+        q.addv_timedwait([(SHType.INTEGER_T, 4), (SHType.JSON_T, '{"test":"value"}'), (SHType.XML_T, '<doc/>')], 0.01)
+        q.add_wait("add wait test data")
+        q.add_timedwait("add timedwait test data", 0.01)
+        print("queue count ", q.count())
+        item = q.remove()
+        print(item)
+        item = q.remove_wait()
+        print(item)
+        item = q.remove_timedwait(0.01)
+        print(item)
+        print("queue count ", q.count())
+        q.destroy()
+    except ShareException as exc:
+        print('queue ops failed:  ', exc)
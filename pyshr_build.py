@@ -2,18 +2,238 @@ from cffi import FFI
 
 ffi = FFI()
 
-ffi.set_source("_pyshr",
+ffi.set_source("pyshr._pyshr",
     """
         #include <shared_q.h>
         #include <time.h>
         #include <stdlib.h>
+
+        // converts timeout in nanoseconds to timespec, flooring like the
+        // python divmod used for the scalar time calls so tv_nsec is never
+        // negative
+        static void pyshr_ns_to_ts(
+            long long ns,
+            struct timespec *ts
+        )
+        {
+            long long sec = ns / 1000000000LL;
+            long long nsec = ns % 1000000000LL;
+
+            if (nsec < 0) {
+                nsec += 1000000000LL;
+                sec--;
+            }
+            ts->tv_sec = (time_t)sec;
+            ts->tv_nsec = (long)nsec;
+        }
+
+        // fills caller's sq_vec_s array from parallel arrays and adds it
+        static sh_status_e pyshr_addv_soa(
+            shr_q_s *q,
+            sq_vec_s *vector,
+            const int *types,
+            const size_t *lens,
+            void * const *bases,
+            int vcnt,
+            int wait,
+            struct timespec *timeout
+        )
+        {
+            sh_status_e status;
+            int i;
+
+            if (vcnt < 1) {
+                return SH_ERR_ARG;
+            }
+            for (i = 0; i < vcnt; i++) {
+                vector[i]._zeroes_ = 0;
+                vector[i].type = (sh_type_e)types[i];
+                vector[i].len = lens[i];
+                vector[i].base = bases[i];
+            }
+            if (timeout != NULL) {
+                status = shr_q_addv_timedwait(q, vector, vcnt, timeout);
+            } else if (wait) {
+                status = shr_q_addv_wait(q, vector, vcnt);
+            } else {
+                status = shr_q_addv(q, vector, vcnt);
+            }
+            return status;
+        }
+
+        static sh_status_e pyshr_addv_unpacked(
+            shr_q_s *q,
+            sq_vec_s *vector,
+            const int *types,
+            const size_t *lens,
+            void * const *bases,
+            int vcnt
+        )
+        {
+            return pyshr_addv_soa(q, vector, types, lens, bases, vcnt,
+                                  0, NULL);
+        }
+
+        static sh_status_e pyshr_addv_unpacked_wait(
+            shr_q_s *q,
+            sq_vec_s *vector,
+            const int *types,
+            const size_t *lens,
+            void * const *bases,
+            int vcnt
+        )
+        {
+            return pyshr_addv_soa(q, vector, types, lens, bases, vcnt,
+                                  1, NULL);
+        }
+
+        static sh_status_e pyshr_addv_unpacked_timedwait(
+            shr_q_s *q,
+            sq_vec_s *vector,
+            const int *types,
+            const size_t *lens,
+            void * const *bases,
+            int vcnt,
+            long long timeout_ns
+        )
+        {
+            struct timespec timeout;
+
+            pyshr_ns_to_ts(timeout_ns, &timeout);
+            return pyshr_addv_soa(q, vector, types, lens, bases, vcnt,
+                                  1, &timeout);
+        }
+
+        static sh_status_e pyshr_add_timedwait_ns(
+            shr_q_s *q,
+            void *value,
+            size_t length,
+            long long timeout_ns
+        )
+        {
+            struct timespec timeout;
+
+            pyshr_ns_to_ts(timeout_ns, &timeout);
+            return shr_q_add_timedwait(q, value, length, &timeout);
+        }
+
+        static sh_status_e pyshr_clean_ns(
+            shr_q_s *q,
+            long long timelimit_ns
+        )
+        {
+            struct timespec timelimit;
+
+            pyshr_ns_to_ts(timelimit_ns, &timelimit);
+            return shr_q_clean(q, &timelimit);
+        }
+
+        // adds item and, if successful, returns next event for queue
+        static sq_event_e pyshr_add_and_event(
+            shr_q_s *q,
+            void *value,
+            size_t length,
+            sh_status_e *status
+        )
+        {
+            *status = shr_q_add(q, value, length);
+            if (*status != SH_OK) {
+                return SQ_EVNT_NONE;
+            }
+            return shr_q_event(q);
+        }
+
+        // adds each value as separate item, stopping at first failure
+        static sh_status_e pyshr_add_many(
+            shr_q_s *q,
+            void * const *values,
+            const size_t *lens,
+            int count,
+            int *added
+        )
+        {
+            sh_status_e status = SH_OK;
+            int i;
+
+            for (i = 0; i < count; i++) {
+                status = shr_q_add(q, values[i], lens[i]);
+                if (status != SH_OK) {
+                    break;
+                }
+            }
+            *added = i;
+            return status;
+        }
+
+        // remove variants that store item in caller owned struct
+        static sh_status_e pyshr_remove_into(
+            shr_q_s *q,
+            sq_item_s *item,
+            void **buffer,
+            size_t *buff_size
+        )
+        {
+            *item = shr_q_remove(q, buffer, buff_size);
+            return item->status;
+        }
+
+        static sh_status_e pyshr_remove_wait_into(
+            shr_q_s *q,
+            sq_item_s *item,
+            void **buffer,
+            size_t *buff_size
+        )
+        {
+            *item = shr_q_remove_wait(q, buffer, buff_size);
+            return item->status;
+        }
+
+        static sh_status_e pyshr_remove_timedwait_into(
+            shr_q_s *q,
+            sq_item_s *item,
+            void **buffer,
+            size_t *buff_size,
+            long long timeout_ns
+        )
+        {
+            struct timespec timeout;
+
+            pyshr_ns_to_ts(timeout_ns, &timeout);
+            *item = shr_q_remove_timedwait(q, buffer, buff_size, &timeout);
+            return item->status;
+        }
+
+        // removes up to max items without blocking, each into its own
+        // buffer so earlier items are not overwritten, returns count removed
+        static int pyshr_remove_batch_into(
+            shr_q_s *q,
+            sq_item_s *items,
+            int max,
+            void **buffers,
+            size_t *buff_sizes,
+            sh_status_e *status
+        )
+        {
+            int i;
+
+            *status = SH_OK;
+            for (i = 0; i < max; i++) {
+                items[i] = shr_q_remove(q, &buffers[i], &buff_sizes[i]);
+                if (items[i].status != SH_OK) {
+                    *status = items[i].status;
+                    break;
+                }
+            }
+            return i;
+        }
     """,
-    libraries=["shr", "rt"]
+    libraries=["shr", "rt"],
+    extra_compile_args=["-O3"]
 )
 
 ffi.cdef("""
 
-void *malloc(size_t size);
+// only needed to release receive buffers that libshr allocates
 void free(void *ptr);
 
 typedef int... time_t;
@@ -320,6 +540,133 @@ extern sh_status_e shr_q_target_delay(
 extern bool shr_q_is_valid(
     char const * const name // name of q as a null terminated string -- not NULL
 );
+
+
+/*
+    pyshr shims -- add vector of items given as parallel arrays of types,
+    lengths and data pointers, filling the caller's sq_vec_s array in C
+*/
+
+sh_status_e pyshr_addv_unpacked(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    sq_vec_s *vector,           // array of vcnt entries to fill -- not NULL
+    const int *types,           // array of sh_type_e values -- not NULL
+    const size_t *lens,         // array of data lengths -- not NULL
+    void * const *bases,        // array of data pointers -- not NULL
+    int vcnt                    // count of each array -- must be >= 1
+);
+
+
+sh_status_e pyshr_addv_unpacked_wait(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    sq_vec_s *vector,           // array of vcnt entries to fill -- not NULL
+    const int *types,           // array of sh_type_e values -- not NULL
+    const size_t *lens,         // array of data lengths -- not NULL
+    void * const *bases,        // array of data pointers -- not NULL
+    int vcnt                    // count of each array -- must be >= 1
+);
+
+
+sh_status_e pyshr_addv_unpacked_timedwait(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    sq_vec_s *vector,           // array of vcnt entries to fill -- not NULL
+    const int *types,           // array of sh_type_e values -- not NULL
+    const size_t *lens,         // array of data lengths -- not NULL
+    void * const *bases,        // array of data pointers -- not NULL
+    int vcnt,                   // count of each array -- must be >= 1
+    long long timeout_ns        // timeout in nanoseconds
+);
+
+
+/*
+    pyshr shims -- timed calls taking a scalar nanosecond count in place of
+    a struct timespec pointer
+*/
+
+sh_status_e pyshr_add_timedwait_ns(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    void *value,                // pointer to item -- not NULL
+    size_t length,              // length of item -- greater than 0
+    long long timeout_ns        // timeout in nanoseconds
+);
+
+
+sh_status_e pyshr_clean_ns(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    long long timelimit_ns      // timelimit in nanoseconds
+);
+
+
+/*
+    pyshr shim -- add item and return the next event in one call, the event
+    is only read when the add succeeds
+*/
+
+sq_event_e pyshr_add_and_event(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    void *value,                // pointer to item -- not NULL
+    size_t length,              // length of item -- greater than 0
+    sh_status_e *status         // pointer to add status -- not NULL
+);
+
+
+/*
+    pyshr shim -- add each value as a separate item in one call, stopping at
+    the first failure and reporting how many were added
+*/
+
+sh_status_e pyshr_add_many(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    void * const *values,       // array of data pointers -- not NULL
+    const size_t *lens,         // array of data lengths -- not NULL
+    int count,                  // count of each array
+    int *added                  // pointer to count of items added -- not NULL
+);
+
+
+/*
+    pyshr shims -- remove item into caller allocated struct, returning the
+    item status, so no struct is returned by value
+*/
+
+sh_status_e pyshr_remove_into(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    sq_item_s *item,            // pointer to item to fill -- not NULL
+    void **buffer,              // address of buffer pointer -- not NULL
+    size_t *buff_size           // pointer to size of buffer -- not NULL
+);
+
+
+sh_status_e pyshr_remove_wait_into(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    sq_item_s *item,            // pointer to item to fill -- not NULL
+    void **buffer,              // address of buffer pointer -- not NULL
+    size_t *buff_size           // pointer to size of buffer -- not NULL
+);
+
+
+sh_status_e pyshr_remove_timedwait_into(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    sq_item_s *item,            // pointer to item to fill -- not NULL
+    void **buffer,              // address of buffer pointer -- not NULL
+    size_t *buff_size,          // pointer to size of buffer -- not NULL
+    long long timeout_ns        // timeout in nanoseconds
+);
+
+
+/*
+    pyshr shim -- remove up to max items without blocking, item i is stored
+    in buffers[i], returns count removed and status that ended the batch
+*/
+
+int pyshr_remove_batch_into(
+    shr_q_s *q,                 // pointer to queue struct -- not NULL
+    sq_item_s *items,           // array of max items to fill -- not NULL
+    int max,                    // maximum items to remove -- greater than 0
+    void **buffers,             // array of max buffer pointers -- not NULL
+    size_t *buff_sizes,         // array of max buffer sizes -- not NULL
+    sh_status_e *status         // pointer to ending status -- not NULL
+);
 """)
 
 if __name__ == "__main__":
@@ -1,13 +1,13 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
 base_dir = os.path.dirname(__file__)
 
 about = {}
-with open(os.path.join(base_dir, "__about__.py")) as f:
+with open(os.path.join(base_dir, "pyshr", "__about__.py")) as f:
     exec(f.read(), about)
 
-CFFI_VERSION = '1.3.1'
+CFFI_VERSION = '1.15'
 
 setup(
     name=about['__title__'],
@@ -17,9 +17,9 @@ setup(
     author_email=about['__email__'],
     url=about['__uri__'],
     license=about['__license__'],
-    py_modules=['pyshr', '__init__', '__about__'],
+    packages=['pyshr'],
     zip_safe=False,
+    python_requires='>=3.7',
     install_requires=['cffi >= ' + CFFI_VERSION],
-    setup_requires=['cffi >= ' + CFFI_VERSION],
     cffi_modules=["pyshr_build.py:ffi"],
 )